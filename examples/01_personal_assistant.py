@@ -19,6 +19,19 @@ from laios.core.agent import AgentController
 from laios.core.types import Config
 
 
+# Onboarding facts seeded into long-term memory before the first turn
+SEED_MEMORIES = (
+    (
+        "The user is a Python developer who prefers concise, type-annotated code",
+        {"source": "onboarding", "topic": "user_preferences"},
+    ),
+    (
+        "The user's main project is an AI-powered code review tool built with LAIOS",
+        {"source": "onboarding", "topic": "project_context"},
+    ),
+)
+
+
 def main():
     print("=== Personal Assistant Example ===\n")
 
@@ -29,15 +42,9 @@ def main():
 
     # Pre-seed long-term memory — the agent will find these on the first message
     print("Seeding long-term memory...")
-    memory.store_long_term(
-        "The user is a Python developer who prefers concise, type-annotated code",
-        metadata={"source": "onboarding", "topic": "user_preferences"},
-    )
-    memory.store_long_term(
-        "The user's main project is an AI-powered code review tool built with LAIOS",
-        metadata={"source": "onboarding", "topic": "project_context"},
-    )
-    print("  Stored 2 long-term memories.\n")
+    for content, metadata in SEED_MEMORIES:
+        memory.store_long_term(content, metadata=metadata)
+    print(f"  Stored {len(SEED_MEMORIES)} long-term memories.\n")
 
     # Create session
     session = agent.create_session(user_id="demo_user")
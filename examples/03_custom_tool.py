@@ -5,6 +5,8 @@ Demonstrates:
   - Class-based BaseTool with custom _validate() and _execute()
   - create_simple_tool() factory for lightweight tools
   - ToolRegistry.execute_tool() and schema inspection
+  - Chunked hashing of large inputs via memoryview
+  - Running several tool calls concurrently with a thread pool
   - Error handling (invalid input path)
 
 Requirements:
@@ -15,6 +17,7 @@ Run:
 """
 
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
 from pydantic import Field, field_validator
@@ -47,17 +50,29 @@ class HashTool(BaseTool):
     input_model = HashInput
     required_permissions = set()
 
+    _CTORS = {"sha256": hashlib.sha256, "md5": hashlib.md5, "sha1": hashlib.sha1}
+    _CHUNK_SIZE = 65536  # inputs at or above this size are hashed in chunks
+
     def _validate(self, input_data: HashInput) -> None:
         """Extra validation: reject strings longer than 1 MB."""
         if len(input_data.text) > 1_000_000:
             raise ValueError("text exceeds 1 MB limit")
 
     def _execute(self, input_data: HashInput) -> dict:
-        h = hashlib.new(input_data.algorithm, input_data.text.encode())
+        text = input_data.text
+        data = text.encode()
+        if len(data) < self._CHUNK_SIZE:
+            h = self._CTORS[input_data.algorithm](data)
+        else:
+            # Feed large inputs as zero-copy chunks; OpenSSL releases the GIL per update()
+            h = self._CTORS[input_data.algorithm]()
+            mv = memoryview(data)
+            for i in range(0, len(mv), self._CHUNK_SIZE):
+                h.update(mv[i:i + self._CHUNK_SIZE])
         return {
             "algorithm": input_data.algorithm,
             "digest": h.hexdigest(),
-            "input_length": len(input_data.text),
+            "input_length": len(text),
         }
 
 
@@ -75,6 +90,29 @@ reverse_tool = create_simple_tool(
 )
 
 
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+ALGORITHMS = ("sha256", "md5", "sha1")
+
+# hashlib releases the GIL for buffers of 2 KB and up; below that threads only add overhead
+PARALLEL_MIN_BYTES = 2048
+
+
+def hash_all(registry: ToolRegistry, text: str) -> dict:
+    """Hash text with every supported algorithm; returns {algorithm: ToolOutput}."""
+    if len(text.encode()) < PARALLEL_MIN_BYTES:
+        return {
+            alg: registry.execute_tool("text.hash", text=text, algorithm=alg)
+            for alg in ALGORITHMS
+        }
+    with ThreadPoolExecutor(max_workers=len(ALGORITHMS)) as pool:
+        futures = {
+            alg: pool.submit(registry.execute_tool, "text.hash", text=text, algorithm=alg)
+            for alg in ALGORITHMS
+        }
+        return {alg: fut.result() for alg, fut in futures.items()}
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 def main():
@@ -93,25 +131,18 @@ def main():
         params = ", ".join(schema.get("parameters", {}).keys())
         print(f"  {name:25s} params=[{params}]")
 
-    # ── HashTool: sha256 (default) ──
-    print("\n--- HashTool: sha256 ---")
-    result = registry.execute_tool("text.hash", text="Hello, LAIOS!")
-    if result.success:
-        print(f"  algorithm : {result.data['algorithm']}")
-        print(f"  digest    : {result.data['digest']}")
-        print(f"  length    : {result.data['input_length']} chars")
-
-    # ── HashTool: md5 ──
-    print("\n--- HashTool: md5 ---")
-    result = registry.execute_tool("text.hash", text="Hello, LAIOS!", algorithm="md5")
-    if result.success:
-        print(f"  digest    : {result.data['digest']}")
-
-    # ── HashTool: sha1 ──
-    print("\n--- HashTool: sha1 ---")
-    result = registry.execute_tool("text.hash", text="Hello, LAIOS!", algorithm="sha1")
-    if result.success:
-        print(f"  digest    : {result.data['digest']}")
+    # ── HashTool: sha256 / md5 / sha1 ──
+    for algorithm, result in hash_all(registry, "Hello, LAIOS!").items():
+        print(f"\n--- HashTool: {algorithm} ---")
+        if result.success:
+            print(f"  digest    : {result.data['digest']}")
+            print(f"  length    : {result.data['input_length']} chars")
+
+    # ── HashTool: large input (chunked path, algorithms hashed concurrently) ──
+    print("\n--- HashTool: 512 KB input ---")
+    for algorithm, result in hash_all(registry, "LAIOS " * 87_381).items():
+        if result.success:
+            print(f"  {algorithm:9s} : {result.data['digest']}")
 
     # ── ReverseTool ──
     print("\n--- ReverseTool ---")
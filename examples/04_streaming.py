@@ -14,6 +14,7 @@ Run:
   python examples/04_streaming.py
 """
 
+import io
 import sys
 import time
 
@@ -34,15 +35,19 @@ def run_non_streaming(agent, session_id: str) -> tuple[str, float]:
 
 def run_streaming(agent, session_id: str) -> tuple[str, float]:
     """Prints tokens as they arrive; returns (full_text, elapsed_seconds)."""
-    chunks = []
+    buf = io.StringIO()
+    write, flush = sys.stdout.write, sys.stdout.flush
     start = time.perf_counter()
-    for chunk in agent.process_message_stream(session_id, PROMPT):
-        sys.stdout.write(chunk)
-        sys.stdout.flush()
-        chunks.append(chunk)
+    for i, chunk in enumerate(agent.process_message_stream(session_id, PROMPT), 1):
+        write(chunk)
+        buf.write(chunk)
+        # Flush every 8 chunks or at a line break instead of once per token
+        if i & 7 == 0 or "\n" in chunk:
+            flush()
+    flush()
     elapsed = time.perf_counter() - start
     print()  # newline after stream ends
-    return "".join(chunks), elapsed
+    return buf.getvalue(), elapsed
 
 
 def main():
@@ -50,11 +55,14 @@ def main():
 
     config = Config()
 
+    # One agent serves both runs; each run gets its own session so the
+    # streaming prompt does not see the non-streaming exchange in its context
+    agent = AgentController(config)
+
     # ── Non-streaming run ──────────────────────────────────────────────────────
     print("--- Non-Streaming ---")
     print(f"Prompt: {PROMPT}\n")
 
-    agent = AgentController(config)
     session = agent.create_session(user_id="stream_demo")
 
     try:
@@ -75,17 +83,16 @@ def main():
     print("\n--- Streaming (tokens appear as they arrive) ---")
     print(f"Prompt: {PROMPT}\n")
 
-    agent2 = AgentController(config)
-    session2 = agent2.create_session(user_id="stream_demo_2")
+    session = agent.create_session(user_id="stream_demo_2")
 
     try:
-        full_text, stream_time = run_streaming(agent2, session2.id)
+        full_text, stream_time = run_streaming(agent, session.id)
     except Exception as exc:
         print(f"\n[ERROR] Streaming failed: {exc}")
-        agent2.shutdown_session(session2.id)
+        agent.shutdown_session(session.id)
         return
 
-    agent2.shutdown_session(session2.id)
+    agent.shutdown_session(session.id)
 
     # ── Comparison ──────────────────────────────────────────────────────────────
     print("\n--- Timing Comparison ---")
@@ -19,7 +19,7 @@ import os
 
 from laios.core.agent import AgentController
 from laios.core.types import Config
-from laios.llm.clients.ollama import OllamaClient
+from laios.llm.providers.ollama import OllamaClient
 from laios.llm.router import LLMRouter
 
 
@@ -33,7 +33,8 @@ def demo_fallback_routing(use_openai: bool) -> None:
     primary = OllamaClient(model="llama2", base_url="http://localhost:11434")
 
     if use_openai:
-        from laios.llm.clients.openai import OpenAIClient
+        # Imported here so Ollama-only runs never load the openai SDK
+        from laios.llm.providers.openai import OpenAIClient
         fallback = OpenAIClient(model="gpt-3.5-turbo", api_key=os.environ["OPENAI_API_KEY"])
         print("  Providers: Ollama (primary) → OpenAI gpt-3.5-turbo (fallback)")
     else:
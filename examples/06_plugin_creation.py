@@ -15,6 +15,7 @@ Run:
   python examples/06_plugin_creation.py
 """
 
+from collections import Counter
 from typing import Any, Dict
 
 from pydantic import Field
@@ -40,20 +41,34 @@ class SentimentTool(BaseTool):
     input_model = SentimentInput
     required_permissions = set()
 
-    _POSITIVE = {"great", "good", "excellent", "wonderful", "happy", "love", "amazing", "fantastic"}
-    _NEGATIVE = {"bad", "terrible", "awful", "horrible", "hate", "poor", "dreadful", "worst"}
+    _POSITIVE = frozenset({"great", "good", "excellent", "wonderful", "happy", "love", "amazing", "fantastic"})
+    _NEGATIVE = frozenset({"bad", "terrible", "awful", "horrible", "hate", "poor", "dreadful", "worst"})
+
+    _BULK_THRESHOLD = 256  # token count above which counting is done in C
 
     def _execute(self, input_data: SentimentInput) -> dict:
-        words = set(input_data.text.lower().split())
-        pos = len(words & self._POSITIVE)
-        neg = len(words & self._NEGATIVE)
+        tokens = input_data.text.lower().split()
+        n = len(tokens)
+        if n > self._BULK_THRESHOLD:
+            # Long texts: tally every token in C, then probe the small lexicons
+            counts = Counter(tokens)
+            pos = sum(counts[w] for w in self._POSITIVE)
+            neg = sum(counts[w] for w in self._NEGATIVE)
+        else:
+            # Short texts: single pass over the tokens — no intermediate set or intersections
+            pos = neg = 0
+            for w in tokens:
+                if w in self._POSITIVE:
+                    pos += 1
+                elif w in self._NEGATIVE:
+                    neg += 1
         if pos > neg:
-            label, score = "positive", round(pos / max(len(words), 1), 3)
+            label, score = "positive", round(pos / max(n, 1), 3)
         elif neg > pos:
-            label, score = "negative", round(-neg / max(len(words), 1), 3)
+            label, score = "negative", round(-neg / max(n, 1), 3)
         else:
             label, score = "neutral", 0.0
-        return {"label": label, "score": score, "word_count": len(words)}
+        return {"label": label, "score": score, "word_count": n}
 
 
 # ── NLPPlugin ─────────────────────────────────────────────────────────────────
@@ -12,9 +12,9 @@ from laios.core.types import Goal
 class TestAgentFlow:
     """Test full agent pipeline"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def agent(self):
-        """Create agent with default config"""
+        """Create agent with default config, shared across the class"""
         config = Config()
         return AgentController(config)
     
@@ -57,7 +57,7 @@ class TestAgentFlow:
         
         assert result is not None
         assert "goal" in result
-        assert result["goal"] == goal
+        assert result["goal"]["id"] == goal.id
 
 
 if __name__ == "__main__":
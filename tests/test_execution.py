@@ -5,6 +5,8 @@ Phase 5: Execution & Monitoring Tests
 """
 
 import asyncio
+import itertools
+import threading
 import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
@@ -23,6 +25,23 @@ from laios.tools.base import BaseTool, ToolCategory, ToolOutput
 from laios.tools.registry import ToolRegistry
 
 
+# Set on teardown so work abandoned by a timed-out task returns immediately
+_work_released = threading.Event()
+
+
+def simulate_work(seconds: float) -> None:
+    """Block until a monotonic deadline passes or the current test ends"""
+    _work_released.wait(seconds)
+
+
+@pytest.fixture(autouse=True)
+def release_simulated_work():
+    """Release any tool still simulating work once the test finishes"""
+    _work_released.clear()
+    yield
+    _work_released.set()
+
+
 # Test Tool
 class TestTool(BaseTool):
     """Simple test tool"""
@@ -33,7 +52,7 @@ class TestTool(BaseTool):
     
     def _execute(self, **kwargs) -> ToolOutput:
         # Simulate some work
-        time.sleep(kwargs.get("sleep_time", 0.1))
+        simulate_work(kwargs.get("sleep_time", 0.01))
         
         if kwargs.get("fail", False):
             return ToolOutput(success=False, error="Simulated failure")
@@ -52,10 +71,26 @@ class SlowTool(BaseTool):
     category = ToolCategory.UTILITY
     
     def _execute(self, **kwargs) -> ToolOutput:
-        time.sleep(kwargs.get("sleep_time", 5.0))
+        simulate_work(kwargs.get("sleep_time", 5.0))
         return ToolOutput(success=True, data="completed")
 
 
+class GatedTool(BaseTool):
+    """Tool that blocks mid-execution until the test releases it"""
+    
+    name = "gated_tool"
+    description = "Gated tool for observing running tasks"
+    category = ToolCategory.UTILITY
+    
+    started = threading.Event()
+    release = threading.Event()
+    
+    def _execute(self, **kwargs) -> ToolOutput:
+        GatedTool.started.set()
+        GatedTool.release.wait(timeout=5)
+        return ToolOutput(success=True, data="released")
+
+
 class CounterTool(BaseTool):
     """Tool that tracks execution count"""
     
@@ -63,32 +98,44 @@ class CounterTool(BaseTool):
     description = "Tool that counts executions"
     category = ToolCategory.UTILITY
     
-    execution_count = 0
+    # next() on itertools.count is atomic, unlike `+= 1` on a class attribute
+    _counter = itertools.count(1)
+    
+    @classmethod
+    def reset(cls) -> None:
+        cls._counter = itertools.count(1)
     
     def _execute(self, **kwargs) -> ToolOutput:
-        CounterTool.execution_count += 1
         return ToolOutput(
             success=True,
-            data={"count": CounterTool.execution_count}
+            data={"count": next(CounterTool._counter)}
         )
 
 
 # Fixtures
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool_registry():
-    """Create tool registry with test tools"""
+    """Create tool registry with test tools, shared across the module"""
     registry = ToolRegistry()
     registry.register_tool(TestTool)
     registry.register_tool(SlowTool)
+    registry.register_tool(GatedTool)
     registry.register_tool(CounterTool)
     return registry
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def executor(tool_registry):
-    """Create executor with test registry"""
-    return Executor(tool_registry, enable_monitoring=True)
+    """Create executor with test registry, shared across the module"""
+    with Executor(tool_registry, enable_monitoring=True) as executor:
+        yield executor
+
+
+@pytest.fixture(autouse=True)
+def reset_counter_tool():
+    """Start every test with a zeroed CounterTool"""
+    CounterTool.reset()
 
 
 @pytest.fixture
@@ -152,6 +199,7 @@ class TestExecutionMetrics:
         assert metrics.start_time is None
         assert metrics.execution_time == 0.0
     
+    @pytest.mark.slow
     def test_start_end(self):
         """Test start and end timing"""
         metrics = ExecutionMetrics("task_123")
@@ -282,6 +330,7 @@ class TestExecutor:
         assert result.error == "Simulated failure"
         assert task.status == TaskStatus.FAILED
     
+    @pytest.mark.slow
     def test_execute_task_with_timeout(self, executor, sample_context):
         """Test task execution with timeout"""
         task = Task(
@@ -343,17 +392,16 @@ class TestExecutor:
     @pytest.mark.asyncio
     async def test_execute_parallel(self, executor, sample_context):
         """Test parallel task execution"""
-        # Reset counter
-        CounterTool.execution_count = 0
-        
+        template = Task(
+            id="task_template",
+            plan_id="plan_1",
+            description="Task template",
+            tool_name="counter_tool",
+            parameters={}
+        )
+        # model_copy skips re-validating the fields shared by every task
         tasks = [
-            Task(
-                id=f"task_{i}",
-                plan_id="plan_1",
-                description=f"Task {i}",
-                tool_name="counter_tool",
-                parameters={}
-            )
+            template.model_copy(update={"id": f"task_{i}", "description": f"Task {i}"})
             for i in range(5)
         ]
         
@@ -365,8 +413,8 @@ class TestExecutor:
         assert all(r.success for r in results)
         assert len(results) == 5
         
-        # Counter should be incremented 5 times
-        assert CounterTool.execution_count == 5
+        # Counter should be incremented 5 times, so the next value is 6
+        assert next(CounterTool._counter) == 6
         
         # Parallel execution should be faster than sequential
         # (assuming some parallelism, though with GIL this is limited)
@@ -401,7 +449,7 @@ class TestExecutor:
             task,
             sample_context,
             max_retries=2,
-            retry_delay=0.1
+            retry_delay=0.0  # no real backoff sleep between attempts
         )
         
         assert result.success
@@ -421,7 +469,7 @@ class TestExecutor:
             task,
             sample_context,
             max_retries=2,
-            retry_delay=0.05
+            retry_delay=0.0
         )
         
         assert not result.success
@@ -447,28 +495,30 @@ class TestExecutor:
         assert not result.success
         assert "cancelled" in result.error.lower()
     
-    def test_get_running_tasks(self, executor, sample_task, sample_context):
+    def test_get_running_tasks(self, executor, sample_context):
         """Test getting running tasks"""
-        import threading
-        
-        def run_slow_task():
-            executor.execute_task(sample_task, sample_context)
+        task = Task(
+            id="task_gated",
+            plan_id="plan_1",
+            description="Gated task",
+            tool_name="gated_tool",
+            parameters={}
+        )
+        GatedTool.started.clear()
+        GatedTool.release.clear()
         
         # Start task in background
-        thread = threading.Thread(target=run_slow_task)
+        thread = threading.Thread(target=executor.execute_task, args=(task, sample_context))
         thread.start()
         
-        # Give it a moment to start
-        time.sleep(0.05)
-        
-        # Check running tasks
-        running = executor.get_running_tasks()
-        
-        # Wait for completion
-        thread.join()
-        
-        # Should have been running at some point
-        # (may not catch it if it finishes too quickly)
+        try:
+            # Probe exactly while the tool is mid-execution
+            assert GatedTool.started.wait(timeout=5)
+            running = executor.get_running_tasks()
+            assert task in running
+        finally:
+            GatedTool.release.set()
+            thread.join()
     
     def test_get_metrics(self, executor, sample_task, sample_context):
         """Test getting execution metrics"""
@@ -532,13 +582,16 @@ class TestExecutorIntegration:
     @pytest.mark.asyncio
     async def test_async_parallel_execution_integration(self, executor, sample_context):
         """Test async parallel execution with multiple tasks"""
+        template = Task(
+            id="task_parallel_template",
+            plan_id="plan_1",
+            description="Parallel task template",
+            tool_name="test_tool",
+            parameters={"sleep_time": 0.1}
+        )
         tasks = [
-            Task(
-                id=f"task_parallel_{i}",
-                plan_id="plan_1",
-                description=f"Parallel task {i}",
-                tool_name="test_tool",
-                parameters={"sleep_time": 0.1}
+            template.model_copy(
+                update={"id": f"task_parallel_{i}", "description": f"Parallel task {i}"}
             )
             for i in range(3)
         ]
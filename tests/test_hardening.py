@@ -17,6 +17,13 @@ from laios.hardening.validation import ConfigValidator, ValidationResult
 from laios.core.types import Config
 
 
+def _raiser(exc_type=ValueError, msg="fail"):
+    """Build a zero-arg callable that raises exc_type(msg)."""
+    def _raise():
+        raise exc_type(msg)
+    return _raise
+
+
 # ============================================================================
 # Circuit Breaker Tests
 # ============================================================================
@@ -36,9 +43,10 @@ class TestCircuitBreaker:
     def test_opens_after_failure_threshold(self):
         cb = CircuitBreaker("test", failure_threshold=3)
 
+        fail = _raiser()
         for i in range(3):
             with pytest.raises(ValueError):
-                cb.call(lambda: (_ for _ in ()).throw(ValueError("fail")))
+                cb.call(fail)
 
         assert cb.state == CircuitState.OPEN
 
@@ -46,28 +54,30 @@ class TestCircuitBreaker:
         cb = CircuitBreaker("test", failure_threshold=1)
 
         with pytest.raises(ValueError):
-            cb.call(lambda: (_ for _ in ()).throw(ValueError("fail")))
+            cb.call(_raiser(ValueError, "fail"))
 
         assert cb.state == CircuitState.OPEN
 
         with pytest.raises(CircuitBreakerError):
             cb.call(lambda: 42)
 
+    @pytest.mark.slow
     def test_half_open_after_recovery_timeout(self):
         cb = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.1)
 
         with pytest.raises(ValueError):
-            cb.call(lambda: (_ for _ in ()).throw(ValueError("fail")))
+            cb.call(_raiser(ValueError, "fail"))
 
         assert cb.state == CircuitState.OPEN
         time.sleep(0.15)
         assert cb.state == CircuitState.HALF_OPEN
 
+    @pytest.mark.slow
     def test_half_open_success_closes_circuit(self):
         cb = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.1)
 
         with pytest.raises(ValueError):
-            cb.call(lambda: (_ for _ in ()).throw(ValueError("fail")))
+            cb.call(_raiser(ValueError, "fail"))
 
         time.sleep(0.15)
         assert cb.state == CircuitState.HALF_OPEN
@@ -76,17 +86,18 @@ class TestCircuitBreaker:
         assert result == "recovered"
         assert cb.state == CircuitState.CLOSED
 
+    @pytest.mark.slow
     def test_half_open_failure_reopens(self):
         cb = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.1)
 
         with pytest.raises(ValueError):
-            cb.call(lambda: (_ for _ in ()).throw(ValueError("fail")))
+            cb.call(_raiser(ValueError, "fail"))
 
         time.sleep(0.15)
         assert cb.state == CircuitState.HALF_OPEN
 
         with pytest.raises(ValueError):
-            cb.call(lambda: (_ for _ in ()).throw(ValueError("fail again")))
+            cb.call(_raiser(ValueError, "fail again"))
 
         assert cb.state == CircuitState.OPEN
 
@@ -94,7 +105,7 @@ class TestCircuitBreaker:
         cb = CircuitBreaker("test", failure_threshold=1)
 
         with pytest.raises(ValueError):
-            cb.call(lambda: (_ for _ in ()).throw(ValueError("fail")))
+            cb.call(_raiser(ValueError, "fail"))
 
         assert cb.state == CircuitState.OPEN
         cb.reset()
@@ -134,6 +145,7 @@ class TestRateLimiter:
         # user2 should have its own bucket
         limiter.check("user2")
 
+    @pytest.mark.slow
     def test_tokens_refill_over_time(self):
         limiter = RateLimiter(rate=100.0, capacity=1)
         limiter.check("user1")
@@ -176,9 +188,14 @@ class TestRateLimiter:
 # ============================================================================
 
 
+@pytest.fixture(scope="session")
+def sanitizer():
+    """Default-configured sanitizer shared across tests"""
+    return InputSanitizer()
+
+
 class TestInputSanitizer:
-    def test_sanitize_normal_input(self):
-        sanitizer = InputSanitizer()
+    def test_sanitize_normal_input(self, sanitizer):
         result = sanitizer.sanitize_input("Hello world")
         assert result == "Hello world"
 
@@ -187,13 +204,11 @@ class TestInputSanitizer:
         with pytest.raises(SanitizationError, match="maximum length"):
             sanitizer.sanitize_input("x" * 11)
 
-    def test_strips_null_bytes(self):
-        sanitizer = InputSanitizer()
+    def test_strips_null_bytes(self, sanitizer):
         result = sanitizer.sanitize_input("hello\x00world")
         assert result == "helloworld"
 
-    def test_detects_shell_injection(self):
-        sanitizer = InputSanitizer()
+    def test_detects_shell_injection(self, sanitizer):
         dangerous_commands = [
             "; rm -rf /",
             "$(cat /etc/passwd)",
@@ -205,8 +220,7 @@ class TestInputSanitizer:
             with pytest.raises(SanitizationError):
                 sanitizer.sanitize_command(cmd)
 
-    def test_allows_safe_commands(self):
-        sanitizer = InputSanitizer()
+    def test_allows_safe_commands(self, sanitizer):
         safe_commands = [
             "ls -la",
             "cat file.txt",
@@ -217,8 +231,7 @@ class TestInputSanitizer:
             result = sanitizer.sanitize_command(cmd)
             assert result == cmd
 
-    def test_path_traversal_resolution(self):
-        sanitizer = InputSanitizer()
+    def test_path_traversal_resolution(self, sanitizer):
         # Path with .. should be resolved
         result = sanitizer.sanitize_path("/tmp/test/../other")
         assert ".." not in result
@@ -227,13 +240,11 @@ class TestInputSanitizer:
         __import__("sys").platform == "win32",
         reason="Unix-specific path test"
     )
-    def test_blocks_sensitive_paths(self):
-        sanitizer = InputSanitizer()
+    def test_blocks_sensitive_paths(self, sanitizer):
         with pytest.raises(SanitizationError, match="blocked"):
             sanitizer.sanitize_path("/etc/shadow")
 
-    def test_url_scheme_validation(self):
-        sanitizer = InputSanitizer()
+    def test_url_scheme_validation(self, sanitizer):
         # Should not raise for http/https
         sanitizer._check_url_safety("https://example.com")
         sanitizer._check_url_safety("http://example.com")
@@ -242,8 +253,7 @@ class TestInputSanitizer:
         with pytest.raises(SanitizationError, match="scheme"):
             sanitizer._check_url_safety("file:///etc/passwd")
 
-    def test_sanitize_tool_params(self):
-        sanitizer = InputSanitizer()
+    def test_sanitize_tool_params(self, sanitizer):
         params = {
             "path": "/tmp/test",
             "content": "hello world",
@@ -277,7 +287,7 @@ class TestHealthChecker:
 
     def test_failing_check(self):
         checker = HealthChecker()
-        checker.register_check("bad", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+        checker.register_check("bad", _raiser(RuntimeError, "boom"))
 
         result = checker.check("bad")
         assert result.status == HealthStatus.UNHEALTHY
@@ -370,7 +380,7 @@ class TestGracefulShutdown:
         called = []
 
         shutdown.register("good1", lambda: called.append("good1"), priority=1)
-        shutdown.register("bad", lambda: (_ for _ in ()).throw(RuntimeError("boom")), priority=2)
+        shutdown.register("bad", _raiser(RuntimeError, "boom"), priority=2)
         shutdown.register("good2", lambda: called.append("good2"), priority=3)
 
         result = shutdown.shutdown()
@@ -5,7 +5,8 @@ Tests plugin lifecycle, events, dependency resolution, and hook dispatching.
 """
 
 import pytest
-from typing import Any, Dict, List, Optional
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional, Set
 
 from laios.plugins.base import PluginBase, PluginContext, PluginMeta
 from laios.plugins.events import EventBus, PLUGIN_LOADED, PLUGIN_UNLOADED
@@ -27,15 +28,17 @@ class SamplePlugin(PluginBase):
     author = "Test Author"
     tags = ["test"]
 
+    MAX_MESSAGES = 100
+
     def __init__(self):
         super().__init__()
         self.load_called = False
         self.unload_called = False
-        self.sessions_started: List[str] = []
-        self.sessions_ended: List[str] = []
-        self.tasks_before: List[str] = []
-        self.tasks_after: List[str] = []
-        self.messages: List[str] = []
+        self.sessions_started: Set[str] = set()
+        self.sessions_ended: Set[str] = set()
+        self.tasks_before: Set[str] = set()
+        self.tasks_after: Set[str] = set()
+        self.messages: Deque[str] = deque(maxlen=self.MAX_MESSAGES)
 
     def on_load(self, context: PluginContext) -> None:
         self.load_called = True
@@ -44,17 +47,17 @@ class SamplePlugin(PluginBase):
         self.unload_called = True
 
     def on_session_start(self, session_id: str, user_id: str) -> None:
-        self.sessions_started.append(session_id)
+        self.sessions_started.add(session_id)
 
     def on_session_end(self, session_id: str) -> None:
-        self.sessions_ended.append(session_id)
+        self.sessions_ended.add(session_id)
 
     def on_before_task(self, task_id: str, tool_name: str, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        self.tasks_before.append(task_id)
+        self.tasks_before.add(task_id)
         return None
 
     def on_after_task(self, task_id: str, tool_name: str, success: bool, result: Any) -> None:
-        self.tasks_after.append(task_id)
+        self.tasks_after.add(task_id)
 
     def on_message(self, session_id: str, role: str, content: str) -> Optional[str]:
         self.messages.append(content)
@@ -126,22 +129,29 @@ class CircularPluginY(PluginBase):
         pass
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool_registry():
     return ToolRegistry()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
     return Config()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event_bus():
     return EventBus()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_event_bus(event_bus):
+    """Drop subscribers and history so the shared bus starts clean for each test."""
+    yield
+    event_bus.clear_all()
+
+
+@pytest.fixture(scope="module")
 def plugin_context(tool_registry, config, event_bus):
     return PluginContext(
         tool_registry=tool_registry,
@@ -155,6 +165,26 @@ def registry(event_bus):
     return PluginRegistry(event_bus=event_bus)
 
 
+@pytest.fixture
+def load_plugin(plugin_context):
+    """Factory: instantiate a plugin class, run on_load and mark it loaded."""
+    def _load(plugin_cls=SamplePlugin):
+        plugin = plugin_cls()
+        plugin.on_load(plugin_context)
+        plugin._loaded = True
+        return plugin
+    return _load
+
+
+@pytest.fixture
+def registry_with_recorder(registry, event_bus):
+    """Registry plus a dict of plugin load/unload event payloads keyed by event name."""
+    received = defaultdict(list)
+    for event in (PLUGIN_LOADED, PLUGIN_UNLOADED):
+        event_bus.subscribe(event, lambda n, d: received[n].append(d))
+    return registry, received
+
+
 # ============================================================================
 # Plugin Base Tests
 # ============================================================================
@@ -357,27 +387,21 @@ class TestEventBus:
 
 
 class TestPluginRegistry:
-    def test_register_plugin(self, registry, plugin_context):
-        plugin = SamplePlugin()
-        plugin.on_load(plugin_context)
-        plugin._loaded = True
+    def test_register_plugin(self, registry, load_plugin):
+        plugin = load_plugin()
         registry.register(plugin)
         assert "sample_plugin" in registry
         assert len(registry) == 1
 
-    def test_unregister_plugin(self, registry, plugin_context):
-        plugin = SamplePlugin()
-        plugin.on_load(plugin_context)
-        plugin._loaded = True
+    def test_unregister_plugin(self, registry, load_plugin):
+        plugin = load_plugin()
         registry.register(plugin)
         assert registry.unregister("sample_plugin")
         assert "sample_plugin" not in registry
         assert plugin.unload_called
 
-    def test_enable_disable(self, registry, plugin_context):
-        plugin = SamplePlugin()
-        plugin.on_load(plugin_context)
-        plugin._loaded = True
+    def test_enable_disable(self, registry, load_plugin):
+        plugin = load_plugin()
         registry.register(plugin)
 
         registry.disable_plugin("sample_plugin")
@@ -386,15 +410,11 @@ class TestPluginRegistry:
         registry.enable_plugin("sample_plugin")
         assert plugin.enabled
 
-    def test_list_plugins_enabled_only(self, registry, plugin_context):
-        p1 = SamplePlugin()
-        p1.on_load(plugin_context)
-        p1._loaded = True
+    def test_list_plugins_enabled_only(self, registry, load_plugin):
+        p1 = load_plugin()
         registry.register(p1)
 
-        p2 = ParamModifyPlugin()
-        p2.on_load(plugin_context)
-        p2._loaded = True
+        p2 = load_plugin(ParamModifyPlugin)
         registry.register(p2)
         registry.disable_plugin("param_modifier")
 
@@ -405,86 +425,57 @@ class TestPluginRegistry:
         assert len(enabled_plugins) == 1
         assert enabled_plugins[0].name == "sample_plugin"
 
-    def test_dispatch_session_start(self, registry, plugin_context):
-        plugin = SamplePlugin()
-        plugin.on_load(plugin_context)
-        plugin._loaded = True
+    @pytest.mark.parametrize("hook, args, check", [
+        ("dispatch_session_start", ("sess-1", "user-1"),
+         lambda plugin, result: "sess-1" in plugin.sessions_started),
+        ("dispatch_session_end", ("sess-1",),
+         lambda plugin, result: "sess-1" in plugin.sessions_ended),
+        ("dispatch_after_task", ("task-1", "tool.x", True, "result"),
+         lambda plugin, result: "task-1" in plugin.tasks_after),
+        # SamplePlugin returns None from on_message, so content passes through unchanged
+        ("dispatch_message", ("sess-1", "user", "hello"),
+         lambda plugin, result: result == "hello" and "hello" in plugin.messages),
+    ], ids=["session_start", "session_end", "after_task", "message"])
+    def test_dispatch_reaches_plugin(self, registry, load_plugin, hook, args, check):
+        plugin = load_plugin()
         registry.register(plugin)
 
-        registry.dispatch_session_start("sess-1", "user-1")
-        assert "sess-1" in plugin.sessions_started
+        result = getattr(registry, hook)(*args)
+        assert check(plugin, result)
 
-    def test_dispatch_session_end(self, registry, plugin_context):
-        plugin = SamplePlugin()
-        plugin.on_load(plugin_context)
-        plugin._loaded = True
-        registry.register(plugin)
-
-        registry.dispatch_session_end("sess-1")
-        assert "sess-1" in plugin.sessions_ended
-
-    def test_dispatch_before_task_chaining(self, registry, plugin_context):
+    def test_dispatch_before_task_chaining(self, registry, load_plugin):
         """Test that parameter modifications chain through plugins."""
-        p1 = ParamModifyPlugin()
-        p1.on_load(plugin_context)
-        p1._loaded = True
+        p1 = load_plugin(ParamModifyPlugin)
         registry.register(p1)
 
         result = registry.dispatch_before_task("task-1", "tool.x", {"key": "value"})
         assert result["injected_by"] == "param_modifier"
         assert result["key"] == "value"
 
-    def test_dispatch_after_task(self, registry, plugin_context):
-        plugin = SamplePlugin()
-        plugin.on_load(plugin_context)
-        plugin._loaded = True
-        registry.register(plugin)
-
-        registry.dispatch_after_task("task-1", "tool.x", True, "result")
-        assert "task-1" in plugin.tasks_after
-
-    def test_dispatch_message(self, registry, plugin_context):
-        plugin = SamplePlugin()
-        plugin.on_load(plugin_context)
-        plugin._loaded = True
-        registry.register(plugin)
-
-        content = registry.dispatch_message("sess-1", "user", "hello")
-        assert content == "hello"  # SamplePlugin returns None (no modification)
-        assert "hello" in plugin.messages
-
-    def test_disabled_plugins_skipped_in_hooks(self, registry, plugin_context):
-        plugin = SamplePlugin()
-        plugin.on_load(plugin_context)
-        plugin._loaded = True
+    def test_disabled_plugins_skipped_in_hooks(self, registry, load_plugin):
+        plugin = load_plugin()
         registry.register(plugin)
         registry.disable_plugin("sample_plugin")
 
         registry.dispatch_session_start("sess-1", "user-1")
         assert len(plugin.sessions_started) == 0  # Should be skipped
 
-    def test_event_emitted_on_register(self, event_bus):
-        registry = PluginRegistry(event_bus=event_bus)
-        received = []
-        event_bus.subscribe(PLUGIN_LOADED, lambda n, d: received.append(d))
-
+    def test_event_emitted_on_register(self, registry_with_recorder):
+        registry, received = registry_with_recorder
         plugin = SamplePlugin()
         plugin._loaded = True
         registry.register(plugin)
-        assert len(received) == 1
-        assert received[0]["name"] == "sample_plugin"
-
-    def test_event_emitted_on_unregister(self, event_bus):
-        registry = PluginRegistry(event_bus=event_bus)
-        received = []
-        event_bus.subscribe(PLUGIN_UNLOADED, lambda n, d: received.append(d))
+        assert len(received[PLUGIN_LOADED]) == 1
+        assert received[PLUGIN_LOADED][0]["name"] == "sample_plugin"
 
+    def test_event_emitted_on_unregister(self, registry_with_recorder):
+        registry, received = registry_with_recorder
         plugin = SamplePlugin()
         plugin._loaded = True
         registry.register(plugin)
         registry.unregister("sample_plugin")
-        assert len(received) == 1
-        assert received[0]["name"] == "sample_plugin"
+        assert len(received[PLUGIN_UNLOADED]) == 1
+        assert received[PLUGIN_UNLOADED][0]["name"] == "sample_plugin"
 
 
 # ============================================================================
@@ -502,7 +493,7 @@ class TestPluginDependencyResolution:
         loader = PluginLoader()
         # B depends on A, so A should come first
         ordered = loader.resolve_load_order([DependentPluginB, DependentPluginA])
-        names = [getattr(cls.__new__(cls), "name", cls.__name__) for cls in ordered]
+        names = [cls.name for cls in ordered]
         assert names.index("plugin_a") < names.index("plugin_b")
 
     def test_diamond_dependency_order(self):
@@ -511,7 +502,7 @@ class TestPluginDependencyResolution:
         ordered = loader.resolve_load_order([
             DependentPluginC, DependentPluginB, DependentPluginA
         ])
-        names = [getattr(cls.__new__(cls), "name", cls.__name__) for cls in ordered]
+        names = [cls.name for cls in ordered]
         assert names.index("plugin_a") < names.index("plugin_b")
         assert names.index("plugin_b") < names.index("plugin_c")
 
@@ -10,8 +10,7 @@ Tests the reflector's ability to:
 """
 
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import Mock, MagicMock
+from itertools import count, repeat
 
 from laios.core.types import (
     Context,
@@ -24,28 +23,35 @@ from laios.core.types import (
     TaskResult,
     TaskStatus,
 )
-from laios.llm.client import LLMClient
-from laios.reflection.reflector import (
-    Reflector,
-    ReflectionCriteria,
-    FailurePattern,
-    Insight,
-)
+from laios.reflection.reflector import Reflector, ReflectionCriteria
 
 
-@pytest.fixture
-def mock_llm_client():
-    """Mock LLM client"""
-    client = Mock(spec=LLMClient)
-    client.generate.return_value = """
+CANNED_LLM_SUGGESTIONS = """
 1. Add better error handling for network operations
 2. Split large tasks into smaller subtasks
 3. Add retry logic for transient failures
 """
-    return client
+
+
+class StubLLMClient:
+    """Stand-in for LLMClient: returns a canned reply and records each call"""
+    
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = []
+    
+    def generate(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.response
 
 
 @pytest.fixture
+def mock_llm_client():
+    """Stub LLM client"""
+    return StubLLMClient(response=CANNED_LLM_SUGGESTIONS)
+
+
+@pytest.fixture(scope="module")
 def reflection_criteria():
     """Standard reflection criteria"""
     return ReflectionCriteria(
@@ -56,6 +62,12 @@ def reflection_criteria():
     )
 
 
+@pytest.fixture(scope="module")
+def default_criteria():
+    """Reflection criteria with every field left at its default"""
+    return ReflectionCriteria()
+
+
 @pytest.fixture
 def reflector(mock_llm_client, reflection_criteria):
     """Create reflector instance"""
@@ -66,7 +78,7 @@ def reflector(mock_llm_client, reflection_criteria):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_context():
     """Sample execution context"""
     return Context(
@@ -78,7 +90,7 @@ def sample_context():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_goal():
     """Sample goal"""
     return Goal(
@@ -87,6 +99,64 @@ def sample_goal():
     )
 
 
+def _plan_with_results(
+    goal,
+    successes,
+    tool_names=None,
+    errors=None,
+    execution_times=None,
+    sequential=False,
+):
+    """Build a plan with one task per entry in ``successes`` and the matching results.
+
+    ``tool_names``, ``errors`` and ``execution_times`` are optional per-task lists;
+    failed tasks default to the error ``"Error {i}"``. With ``sequential`` each task
+    depends on the one before it.
+    """
+    plan = Plan(
+        id="plan-1",
+        goal=goal,
+        status=PlanStatus.COMPLETED if all(successes) else PlanStatus.FAILED,
+    )
+    rows = zip(
+        successes,
+        tool_names or repeat("test.tool"),
+        errors or (f"Error {i}" for i in count()),
+        execution_times or repeat(1.0),
+    )
+    results = []
+    for i, (success, tool_name, error, execution_time) in enumerate(rows):
+        plan.tasks.append(Task(
+            id=f"task-{i}",
+            plan_id="plan-1",
+            description=f"Task {i}",
+            tool_name=tool_name,
+            status=TaskStatus.COMPLETED if success else TaskStatus.FAILED,
+            error=None if success else error,
+            dependencies=[f"task-{i-1}"] if sequential and i > 0 else [],
+        ))
+        results.append(TaskResult(
+            task_id=f"task-{i}",
+            success=success,
+            output=f"result-{i}" if success else None,
+            error=None if success else error,
+            execution_time_seconds=execution_time,
+        ))
+    return plan, results
+
+
+def _mentions(items, *needles):
+    """True if any of ``needles`` appears, case-insensitively, in any of ``items``"""
+    text = "\n".join(items).lower()
+    return any(needle in text for needle in needles)
+
+
+@pytest.fixture(scope="module")
+def successful_plan(sample_goal):
+    """Three-task plan where every task succeeded, with its results (read-only)"""
+    return _plan_with_results(sample_goal, [True] * 3)
+
+
 class TestTaskEvaluation:
     """Test task-level evaluation"""
     
@@ -166,8 +236,8 @@ class TestTaskEvaluation:
         
         assert evaluation.success is False
         assert len(evaluation.issues) > 0
-        assert any("timeout" in issue.lower() for issue in evaluation.issues)
-        assert any("timeout" in sug.lower() for sug in evaluation.suggestions)
+        assert _mentions(evaluation.issues, "timeout")
+        assert _mentions(evaluation.suggestions, "timeout")
     
     def test_evaluate_slow_task(self, reflector, sample_context):
         """Test evaluation of task that took too long"""
@@ -192,74 +262,46 @@ class TestTaskEvaluation:
         
         assert evaluation.success is False  # Success but with issues
         assert len(evaluation.issues) > 0
-        assert any("took" in issue.lower() for issue in evaluation.issues)
+        assert _mentions(evaluation.issues, "took")
         assert len(evaluation.suggestions) > 0
     
-    def test_error_categorization(self, reflector, sample_context):
+    @pytest.mark.parametrize("error_msg", [
+        pytest.param("Connection timeout", id="timeout"),
+        pytest.param("Permission denied", id="permission"),
+        pytest.param("File not found", id="not_found"),
+        pytest.param("Network unreachable", id="network"),
+        pytest.param("Invalid parameter", id="validation"),
+        pytest.param("Out of memory", id="resource"),
+    ])
+    def test_error_categorization(self, reflector, sample_context, error_msg):
         """Test different error types are categorized correctly"""
-        error_tests = [
-            ("Connection timeout", "timeout"),
-            ("Permission denied", "permission"),
-            ("File not found", "not_found"),
-            ("Network unreachable", "network"),
-            ("Invalid parameter", "validation"),
-            ("Out of memory", "resource"),
-        ]
-        
-        for error_msg, expected_category in error_tests:
-            task = Task(
-                id="task-1",
-                plan_id="plan-1",
-                description="Test task",
-                tool_name="test.tool",
-            )
-            task.error = error_msg
-            
-            result = TaskResult(
-                task_id="task-1",
-                success=False,
-                error=error_msg,
-                execution_time_seconds=0.1,
-            )
-            
-            evaluation = reflector.evaluate_task(task, result, sample_context)
-            
-            # Check that appropriate suggestions are given
-            assert len(evaluation.suggestions) > 0
+        task = Task(
+            id="task-1",
+            plan_id="plan-1",
+            description="Test task",
+            tool_name="test.tool",
+        )
+        task.error = error_msg
+        
+        result = TaskResult(
+            task_id="task-1",
+            success=False,
+            error=error_msg,
+            execution_time_seconds=0.1,
+        )
+        
+        evaluation = reflector.evaluate_task(task, result, sample_context)
+        
+        # Check that appropriate suggestions are given
+        assert len(evaluation.suggestions) > 0
 
 
 class TestPlanEvaluation:
     """Test plan-level evaluation"""
     
-    def test_evaluate_successful_plan(self, reflector, sample_goal, sample_context):
+    def test_evaluate_successful_plan(self, reflector, successful_plan, sample_context):
         """Test evaluation of fully successful plan"""
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.COMPLETED,
-        )
-        
-        # Add completed tasks
-        for i in range(3):
-            task = Task(
-                id=f"task-{i}",
-                plan_id="plan-1",
-                description=f"Task {i}",
-                tool_name="test.tool",
-                status=TaskStatus.COMPLETED,
-            )
-            plan.tasks.append(task)
-        
-        # Create results
-        results = [
-            TaskResult(
-                task_id=f"task-{i}",
-                success=True,
-                output=f"result-{i}",
-                execution_time_seconds=1.0,
-            )
-            for i in range(3)
-        ]
+        plan, results = successful_plan
         
         evaluation = reflector.evaluate_plan(plan, results, sample_context)
         
@@ -270,36 +312,7 @@ class TestPlanEvaluation:
     
     def test_evaluate_partially_failed_plan(self, reflector, sample_goal, sample_context):
         """Test evaluation of plan with some failures"""
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.FAILED,
-        )
-        
-        # Add mixed tasks
-        for i in range(5):
-            status = TaskStatus.COMPLETED if i < 3 else TaskStatus.FAILED
-            task = Task(
-                id=f"task-{i}",
-                plan_id="plan-1",
-                description=f"Task {i}",
-                tool_name="test.tool",
-                status=status,
-                error=f"Error {i}" if status == TaskStatus.FAILED else None,
-            )
-            plan.tasks.append(task)
-        
-        # Create results
-        results = [
-            TaskResult(
-                task_id=f"task-{i}",
-                success=(i < 3),
-                output=f"result-{i}" if i < 3 else None,
-                error=f"Error {i}" if i >= 3 else None,
-                execution_time_seconds=1.0,
-            )
-            for i in range(5)
-        ]
+        plan, results = _plan_with_results(sample_goal, [True] * 3 + [False] * 2)
         
         evaluation = reflector.evaluate_plan(plan, results, sample_context)
         
@@ -316,39 +329,20 @@ class TestPlanEvaluation:
         sample_context
     ):
         """Test detection of repeated error patterns"""
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.FAILED,
+        # Tasks with same error type
+        plan, results = _plan_with_results(
+            sample_goal,
+            [False] * 4,
+            tool_names=["web.fetch"] * 4,
+            errors=["Connection timeout"] * 4,
+            execution_times=[30.0] * 4,
         )
         
-        # Add tasks with same error type
-        for i in range(4):
-            task = Task(
-                id=f"task-{i}",
-                plan_id="plan-1",
-                description=f"Network task {i}",
-                tool_name="web.fetch",
-                status=TaskStatus.FAILED,
-                error="Connection timeout",
-            )
-            plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id=f"task-{i}",
-                success=False,
-                error="Connection timeout",
-                execution_time_seconds=30.0,
-            )
-            for i in range(4)
-        ]
-        
         evaluation = reflector.evaluate_plan(plan, results, sample_context)
         
         # Should detect timeout pattern
         assert len(evaluation.issues) > 0
-        assert any("timeout" in issue.lower() for issue in evaluation.issues)
+        assert _mentions(evaluation.issues, "timeout")
         
         # Check stored patterns
         patterns = reflector.get_failure_patterns()
@@ -364,34 +358,14 @@ class TestPlanEvaluation:
         sample_context
     ):
         """Test detection of tool-specific failures"""
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.FAILED,
+        # Tasks with same failing tool
+        plan, results = _plan_with_results(
+            sample_goal,
+            [False] * 3,
+            tool_names=["buggy.tool"] * 3,
+            errors=[f"Execution error {i}" for i in range(3)],
         )
         
-        # Add tasks with same failing tool
-        for i in range(3):
-            task = Task(
-                id=f"task-{i}",
-                plan_id="plan-1",
-                description=f"Task {i}",
-                tool_name="buggy.tool",
-                status=TaskStatus.FAILED,
-                error=f"Execution error {i}",
-            )
-            plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id=f"task-{i}",
-                success=False,
-                error=f"Execution error {i}",
-                execution_time_seconds=1.0,
-            )
-            for i in range(3)
-        ]
-        
         evaluation = reflector.evaluate_plan(plan, results, sample_context)
         
         # Should detect tool failure pattern
@@ -402,131 +376,38 @@ class TestPlanEvaluation:
     
     def test_plan_structure_evaluation(self, reflector, sample_goal, sample_context):
         """Test evaluation of plan structure"""
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.COMPLETED,
-        )
-        
         # Create long sequential chain
-        for i in range(8):
-            task = Task(
-                id=f"task-{i}",
-                plan_id="plan-1",
-                description=f"Sequential task {i}",
-                tool_name="test.tool",
-                status=TaskStatus.COMPLETED,
-                dependencies=[f"task-{i-1}"] if i > 0 else [],
-            )
-            plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id=f"task-{i}",
-                success=True,
-                output=f"result-{i}",
-                execution_time_seconds=1.0,
-            )
-            for i in range(8)
-        ]
+        plan, results = _plan_with_results(sample_goal, [True] * 8, sequential=True)
         
         evaluation = reflector.evaluate_plan(plan, results, sample_context)
         
         # Should suggest parallelization
-        assert any(
-            "sequential" in issue.lower() or "parallel" in issue.lower()
-            for issue in evaluation.issues
-        )
+        assert _mentions(evaluation.issues, "sequential", "parallel")
     
-    def test_llm_reflection_integration(
+    @pytest.mark.parametrize("enabled", [True, False], ids=["enabled", "disabled"])
+    def test_llm_reflection_toggle(
         self,
         mock_llm_client,
         reflection_criteria,
         sample_goal,
-        sample_context
+        sample_context,
+        enabled,
     ):
-        """Test LLM-based reflection"""
+        """Test that LLM-based reflection runs only when enabled"""
         reflector = Reflector(
             llm_client=mock_llm_client,
             criteria=reflection_criteria,
-            enable_llm_reflection=True,
+            enable_llm_reflection=enabled,
         )
         
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.FAILED,
-        )
-        
-        task = Task(
-            id="task-1",
-            plan_id="plan-1",
-            description="Failed task",
-            tool_name="test.tool",
-            status=TaskStatus.FAILED,
-            error="Network error",
-        )
-        plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id="task-1",
-                success=False,
-                error="Network error",
-                execution_time_seconds=1.0,
-            )
-        ]
+        plan, results = _plan_with_results(sample_goal, [False], errors=["Network error"])
         
         evaluation = reflector.evaluate_plan(plan, results, sample_context)
         
-        # Should have called LLM
-        assert mock_llm_client.generate.called
-        
-        # Should have suggestions from LLM
-        assert len(evaluation.suggestions) > 0
-    
-    def test_disable_llm_reflection(
-        self,
-        mock_llm_client,
-        reflection_criteria,
-        sample_goal,
-        sample_context
-    ):
-        """Test that LLM reflection can be disabled"""
-        reflector = Reflector(
-            llm_client=mock_llm_client,
-            criteria=reflection_criteria,
-            enable_llm_reflection=False,
-        )
-        
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.FAILED,
-        )
-        
-        task = Task(
-            id="task-1",
-            plan_id="plan-1",
-            description="Failed task",
-            tool_name="test.tool",
-            status=TaskStatus.FAILED,
-        )
-        plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id="task-1",
-                success=False,
-                error="Error",
-                execution_time_seconds=1.0,
-            )
-        ]
-        
-        evaluation = reflector.evaluate_plan(plan, results, sample_context)
-        
-        # Should NOT have called LLM
-        assert not mock_llm_client.generate.called
+        assert bool(mock_llm_client.calls) is enabled
+        if enabled:
+            # Should have suggestions from LLM
+            assert len(evaluation.suggestions) > 0
 
 
 class TestLearning:
@@ -539,33 +420,14 @@ class TestLearning:
         sample_context
     ):
         """Test learning from successful episode"""
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.COMPLETED,
+        # Tasks with various tools
+        plan, results = _plan_with_results(
+            sample_goal,
+            [True] * 5,
+            tool_names=[f"tool-{i % 2}" for i in range(5)],  # Alternate between 2 tools
+            execution_times=[1.0 + i * 0.5 for i in range(5)],
         )
         
-        # Add tasks with various tools
-        for i in range(5):
-            task = Task(
-                id=f"task-{i}",
-                plan_id="plan-1",
-                description=f"Task {i}",
-                tool_name=f"tool-{i % 2}",  # Alternate between 2 tools
-                status=TaskStatus.COMPLETED,
-            )
-            plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id=f"task-{i}",
-                success=True,
-                output=f"result-{i}",
-                execution_time_seconds=1.0 + i * 0.5,
-            )
-            for i in range(5)
-        ]
-        
         episode = Episode(
             id="episode-1",
             session_id="session-1",
@@ -589,35 +451,8 @@ class TestLearning:
         sample_context
     ):
         """Test learning from failed episode"""
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.FAILED,
-        )
-        
-        # Add mix of successful and failed tasks
-        for i in range(6):
-            status = TaskStatus.COMPLETED if i < 2 else TaskStatus.FAILED
-            task = Task(
-                id=f"task-{i}",
-                plan_id="plan-1",
-                description=f"Task {i}",
-                tool_name="test.tool",
-                status=status,
-                error=f"Error {i}" if status == TaskStatus.FAILED else None,
-            )
-            plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id=f"task-{i}",
-                success=(i < 2),
-                output=f"result-{i}" if i < 2 else None,
-                error=f"Error {i}" if i >= 2 else None,
-                execution_time_seconds=1.0,
-            )
-            for i in range(6)
-        ]
+        # Mix of successful and failed tasks
+        plan, results = _plan_with_results(sample_goal, [True] * 2 + [False] * 4)
         
         episode = Episode(
             id="episode-1",
@@ -636,34 +471,13 @@ class TestLearning:
     
     def test_timing_analysis(self, reflector, sample_goal, sample_context):
         """Test timing pattern analysis"""
-        plan = Plan(
-            id="plan-1",
-            goal=sample_goal,
-            status=PlanStatus.COMPLETED,
-        )
-        
-        # Add tasks with varying execution times
+        # Tasks with varying execution times
         execution_times = [1.0, 1.2, 0.9, 1.1, 10.0, 1.0]  # One outlier
-        
-        for i, exec_time in enumerate(execution_times):
-            task = Task(
-                id=f"task-{i}",
-                plan_id="plan-1",
-                description=f"Task {i}",
-                tool_name="test.tool",
-                status=TaskStatus.COMPLETED,
-            )
-            plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id=f"task-{i}",
-                success=True,
-                output=f"result-{i}",
-                execution_time_seconds=exec_time,
-            )
-            for i, exec_time in enumerate(execution_times)
-        ]
+        plan, results = _plan_with_results(
+            sample_goal,
+            [True] * len(execution_times),
+            execution_times=execution_times,
+        )
         
         episode = Episode(
             id="episode-1",
@@ -679,29 +493,10 @@ class TestLearning:
         perf_insights = [i for i in insights if i.category == "performance"]
         assert len(perf_insights) > 0
     
-    def test_get_insights_filtering(self, reflector, sample_goal, sample_context):
+    def test_get_insights_filtering(self, reflector, successful_plan, sample_context):
         """Test insight retrieval with filtering"""
         # Generate some insights
-        plan = Plan(id="plan-1", goal=sample_goal)
-        for i in range(3):
-            task = Task(
-                id=f"task-{i}",
-                plan_id="plan-1",
-                description=f"Task {i}",
-                tool_name="tool-0",
-                status=TaskStatus.COMPLETED,
-            )
-            plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id=f"task-{i}",
-                success=True,
-                output="result",
-                execution_time_seconds=1.0,
-            )
-            for i in range(3)
-        ]
+        plan, results = successful_plan
         
         episode = Episode(
             id="episode-1",
@@ -724,25 +519,7 @@ class TestLearning:
     def test_clear_learning_data(self, reflector, sample_goal, sample_context):
         """Test clearing learning data"""
         # Generate some data
-        plan = Plan(id="plan-1", goal=sample_goal)
-        task = Task(
-            id="task-1",
-            plan_id="plan-1",
-            description="Task",
-            tool_name="test.tool",
-            status=TaskStatus.FAILED,
-            error="Error",
-        )
-        plan.tasks.append(task)
-        
-        results = [
-            TaskResult(
-                task_id="task-1",
-                success=False,
-                error="Error",
-                execution_time_seconds=1.0,
-            )
-        ]
+        plan, results = _plan_with_results(sample_goal, [False], errors=["Error"])
         
         # Generate patterns and insights
         reflector.evaluate_plan(plan, results, sample_context)
@@ -771,14 +548,12 @@ class TestLearning:
 class TestReflectionCriteria:
     """Test reflection criteria configuration"""
     
-    def test_default_criteria(self):
+    def test_default_criteria(self, default_criteria):
         """Test default criteria values"""
-        criteria = ReflectionCriteria()
-        
-        assert criteria.min_success_rate == 0.8
-        assert criteria.max_execution_time_multiplier == 2.0
-        assert criteria.require_all_tasks_complete is True
-        assert criteria.check_output_quality is True
+        assert default_criteria.min_success_rate == 0.8
+        assert default_criteria.max_execution_time_multiplier == 2.0
+        assert default_criteria.require_all_tasks_complete is True
+        assert default_criteria.check_output_quality is True
     
     def test_custom_criteria(self):
         """Test custom criteria"""
@@ -2,6 +2,7 @@
 Tests for filesystem tools
 """
 
+import os
 import pytest
 import tempfile
 from pathlib import Path
@@ -14,6 +15,44 @@ from laios.tools.builtin.filesystem import (
 )
 
 
+# These tests are almost pure file I/O, so keep their scratch files in RAM where available
+RAM_TMP_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+@pytest.fixture
+def tmp_path():
+    """Per-test scratch directory under RAM_TMP_ROOT (falls back to the OS temp dir)"""
+    with tempfile.TemporaryDirectory(dir=RAM_TMP_ROOT, prefix="laios-test-") as path:
+        yield Path(path)
+
+
+def _make_files(root, files):
+    """Create each (name, data) file under root with raw os calls, no text encoding"""
+    for name, data in files:
+        fd = os.open(os.path.join(root, name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture(scope="module")
+def listing_dir():
+    """Directory shared by the read-only listing tests"""
+    with tempfile.TemporaryDirectory(dir=RAM_TMP_ROOT, prefix="laios-test-") as path:
+        _make_files(path, [
+            ("file1.txt", b"content1"),
+            ("file2.txt", b"content2"),
+            ("test.py", b"python"),
+            ("test.txt", b"text"),
+            ("readme.md", b"markdown"),
+            ("visible.txt", b"visible"),
+            (".hidden", b"hidden"),
+        ])
+        os.mkdir(os.path.join(path, "subdir"))
+        yield Path(path)
+
+
 class TestReadFileTool:
     """Tests for ReadFileTool"""
     
@@ -97,15 +136,10 @@ class TestWriteFileTool:
 class TestListDirectoryTool:
     """Tests for ListDirectoryTool"""
     
-    def test_list_directory(self, tmp_path):
+    def test_list_directory(self, listing_dir):
         """Test listing directory contents"""
-        # Create test files
-        (tmp_path / "file1.txt").write_text("content1")
-        (tmp_path / "file2.txt").write_text("content2")
-        (tmp_path / "subdir").mkdir()
-        
         tool = ListDirectoryTool()
-        result = tool.execute(path=str(tmp_path))
+        result = tool.execute(path=str(listing_dir))
         
         assert result.success
         assert isinstance(result.data, list)
@@ -116,35 +150,39 @@ class TestListDirectoryTool:
         assert "file2.txt" in names
         assert "subdir" in names
     
-    def test_list_with_pattern(self, tmp_path):
+    def test_list_with_pattern(self, listing_dir):
         """Test listing with glob pattern"""
-        (tmp_path / "test.py").write_text("python")
-        (tmp_path / "test.txt").write_text("text")
-        (tmp_path / "readme.md").write_text("markdown")
-        
         tool = ListDirectoryTool()
-        result = tool.execute(path=str(tmp_path), pattern="*.py")
+        result = tool.execute(path=str(listing_dir), pattern="*.py")
         
         assert result.success
         assert len(result.data) == 1
         assert result.data[0]["name"] == "test.py"
     
-    def test_list_hidden_files(self, tmp_path):
+    def test_list_hidden_files(self, listing_dir):
         """Test including/excluding hidden files"""
-        (tmp_path / "visible.txt").write_text("visible")
-        (tmp_path / ".hidden").write_text("hidden")
-        
         tool = ListDirectoryTool()
         
         # Without hidden files
-        result1 = tool.execute(path=str(tmp_path), include_hidden=False)
+        result1 = tool.execute(path=str(listing_dir), include_hidden=False)
         names1 = [item["name"] for item in result1.data]
         assert ".hidden" not in names1
         
         # With hidden files
-        result2 = tool.execute(path=str(tmp_path), include_hidden=True)
+        result2 = tool.execute(path=str(listing_dir), include_hidden=True)
         names2 = [item["name"] for item in result2.data]
         assert ".hidden" in names2
+    
+    @pytest.mark.parametrize("n", [100, 1_000, 10_000])
+    def test_list_scaling(self, tmp_path, n):
+        """Test that every entry is returned as the directory grows"""
+        _make_files(tmp_path, ((f"file{i:05d}.txt", b"") for i in range(n)))
+        
+        tool = ListDirectoryTool()
+        result = tool.execute(path=str(tmp_path))
+        
+        assert result.success
+        assert len(result.data) == n
 
 
 class TestGetFileInfoTool:
@@ -1,9 +1,12 @@
 """
 Tests for LLM integration
 
-Note: These tests require Ollama to be running and a model to be available.
+Note: TestOllamaClient requires Ollama to be running and a model to be available.
+Set LAIOS_E2E_OLLAMA=1 to run it.
 """
 
+import os
+
 import pytest
 
 from laios.llm.client import LLMMessage
@@ -38,25 +41,29 @@ class TestPrompts:
         assert result == "Hello, Alice! You are 30 years old."
 
 
+@pytest.fixture(scope="module")
+def ollama_client():
+    """One Ollama client for the whole module so its HTTP connection is reused"""
+    from laios.llm.providers.ollama import OllamaClient
+    
+    return OllamaClient(model="llama2")
+
+
 # Tests requiring Ollama running
-@pytest.mark.skipif(True, reason="Requires Ollama running - run manually")
+@pytest.mark.skipif(
+    not os.environ.get("LAIOS_E2E_OLLAMA"),
+    reason="Requires Ollama running - set LAIOS_E2E_OLLAMA=1",
+)
 class TestOllamaClient:
     """Tests for Ollama client (manual)"""
     
-    def test_ollama_initialization(self):
+    def test_ollama_initialization(self, ollama_client):
         """Test initializing Ollama client"""
-        from laios.llm.providers.ollama import OllamaClient
-        
-        client = OllamaClient(model="llama2")
-        assert client.model == "llama2"
+        assert ollama_client.model == "llama2"
     
-    def test_ollama_generation(self):
+    def test_ollama_generation(self, ollama_client):
         """Test generating response"""
-        from laios.llm.providers.ollama import OllamaClient
-        
-        client = OllamaClient(model="llama2")
-        
-        response = client.generate_with_system(
+        response = ollama_client.generate_with_system(
             system_prompt="You are a helpful assistant.",
             user_message="Say 'Hello, LAIOS!' and nothing else.",
             temperature=0.0,
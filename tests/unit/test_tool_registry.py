@@ -19,6 +19,22 @@ class DummyTool(BaseTool):
         return "dummy output"
 
 
+@pytest.fixture
+def registry():
+    """Fresh registry with DummyTool registered"""
+    registry = ToolRegistry()
+    registry.register_tool(DummyTool)
+    return registry
+
+
+@pytest.fixture(scope="module")
+def shared_registry():
+    """Registry with DummyTool registered, shared by tests that don't modify it"""
+    registry = ToolRegistry()
+    registry.register_tool(DummyTool)
+    return registry
+
+
 class TestToolRegistry:
     """Tests for ToolRegistry"""
     
@@ -30,30 +46,21 @@ class TestToolRegistry:
         assert len(registry) == 1
         assert registry.has_tool("test.dummy")
     
-    def test_get_tool(self):
+    def test_get_tool(self, shared_registry):
         """Test retrieving a tool"""
-        registry = ToolRegistry()
-        registry.register_tool(DummyTool)
-        
-        tool = registry.get_tool("test.dummy")
+        tool = shared_registry.get_tool("test.dummy")
         assert tool is not None
         assert tool.name == "test.dummy"
     
-    def test_list_tools(self):
+    def test_list_tools(self, shared_registry):
         """Test listing all tools"""
-        registry = ToolRegistry()
-        registry.register_tool(DummyTool)
-        
-        tools = registry.list_tools()
+        tools = shared_registry.list_tools()
         assert len(tools) == 1
         assert tools[0].name == "test.dummy"
     
-    def test_execute_tool(self):
+    def test_execute_tool(self, shared_registry):
         """Test executing a tool through registry"""
-        registry = ToolRegistry()
-        registry.register_tool(DummyTool)
-        
-        result = registry.execute_tool("test.dummy")
+        result = shared_registry.execute_tool("test.dummy")
         assert result.success
         assert result.data == "dummy output"
     
@@ -65,31 +72,22 @@ class TestToolRegistry:
         assert not result.success
         assert "not found" in result.error.lower()
     
-    def test_get_tool_schema(self):
+    def test_get_tool_schema(self, shared_registry):
         """Test getting tool schema"""
-        registry = ToolRegistry()
-        registry.register_tool(DummyTool)
-        
-        schema = registry.get_tool_schema("test.dummy")
+        schema = shared_registry.get_tool_schema("test.dummy")
         assert schema is not None
         assert schema["name"] == "test.dummy"
         assert "description" in schema
         assert "parameters" in schema
     
-    def test_unregister_tool(self):
+    def test_unregister_tool(self, registry):
         """Test removing a tool"""
-        registry = ToolRegistry()
-        registry.register_tool(DummyTool)
-        
         assert len(registry) == 1
         registry.unregister_tool("test.dummy")
         assert len(registry) == 0
     
-    def test_clear_registry(self):
+    def test_clear_registry(self, registry):
         """Test clearing all tools"""
-        registry = ToolRegistry()
-        registry.register_tool(DummyTool)
-        
         registry.clear()
         assert len(registry) == 0
 
@@ -17,6 +17,12 @@ from laios.core.types import (
 )
 
 
+@pytest.fixture(scope="module")
+def goal():
+    """Goal shared by the plan tests; plans only hold a reference to it"""
+    return Goal(description="Test goal")
+
+
 class TestGoal:
     """Tests for Goal model"""
     
@@ -67,16 +73,14 @@ class TestTask:
 class TestPlan:
     """Tests for Plan model"""
     
-    def test_plan_creation(self):
-        goal = Goal(description="Test goal")
+    def test_plan_creation(self, goal):
         plan = Plan(goal=goal)
         
         assert plan.goal == goal
         assert plan.status == PlanStatus.DRAFT
         assert len(plan.tasks) == 0
     
-    def test_get_task(self):
-        goal = Goal(description="Test goal")
+    def test_get_task(self, goal):
         plan = Plan(goal=goal)
         
         task = Task(
@@ -90,8 +94,7 @@ class TestPlan:
         assert retrieved is not None
         assert retrieved.id == task.id
     
-    def test_get_ready_tasks(self):
-        goal = Goal(description="Test goal")
+    def test_get_ready_tasks(self, goal):
         plan = Plan(goal=goal)
         
         task1 = Task(